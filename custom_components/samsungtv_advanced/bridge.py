@@ -200,8 +200,14 @@ class SamsungTVBridge(ABC):
         """Tells if the TV is on."""
 
     @abstractmethod
-    async def async_send_keys(self, keys: list[str]) -> None:
-        """Send a list of keys to the tv."""
+    async def async_send_keys(
+        self, keys: list[str], key_press_delay: float | None = None
+    ) -> None:
+        """Send a list of keys to the tv.
+
+        key_press_delay optionally shortens the delay (in seconds) between keys
+        on bridges that support it; the legacy bridge always uses its default.
+        """
 
     async def async_power_off(self) -> None:
         """Send power off command to remote and close."""
@@ -318,8 +324,13 @@ class SamsungTVLegacyBridge(SamsungTVBridge):
                 pass
         return self._remote
 
-    async def async_send_keys(self, keys: list[str]) -> None:
-        """Send a list of keys using legacy protocol."""
+    async def async_send_keys(
+        self, keys: list[str], key_press_delay: float | None = None
+    ) -> None:
+        """Send a list of keys using legacy protocol.
+
+        key_press_delay is ignored: legacy TVs keep the default delay between keys.
+        """
         first_key = True
         for key in keys:
             if first_key:
@@ -389,7 +400,9 @@ class SamsungTVWSBaseBridge(SamsungTVBridge, Generic[_RemoteT, _CommandT]):
             return remote.is_alive()  # type: ignore[no-any-return]
         return False
 
-    async def _async_send_commands(self, commands: list[_CommandT]) -> None:
+    async def _async_send_commands(
+        self, commands: list[_CommandT], key_press_delay: float | None = None
+    ) -> None:
         """Send the commands using websocket protocol."""
         try:
             # recreate connection if connection was dead
@@ -397,7 +410,7 @@ class SamsungTVWSBaseBridge(SamsungTVBridge, Generic[_RemoteT, _CommandT]):
             for _ in range(retry_count + 1):
                 try:
                     if remote := await self._async_get_remote():
-                        await remote.send_commands(commands)
+                        await remote.send_commands(commands, key_press_delay)
                     break
                 except (
                     BrokenPipeError,
@@ -554,9 +567,13 @@ class SamsungTVWSBridge(
         """Get installed app list."""
         await self._async_send_commands([ChannelEmitCommand.get_installed_app()])
 
-    async def async_send_keys(self, keys: list[str]) -> None:
+    async def async_send_keys(
+        self, keys: list[str], key_press_delay: float | None = None
+    ) -> None:
         """Send a list of keys using websocket protocol."""
-        await self._async_send_commands([SendRemoteKey.click(key) for key in keys])
+        await self._async_send_commands(
+            [SendRemoteKey.click(key) for key in keys], key_press_delay
+        )
 
     async def _async_get_remote_under_lock(self) -> SamsungTVWSAsyncRemote | None:
         """Create or return a remote control instance."""
@@ -739,10 +756,12 @@ class SamsungTVEncryptedBridge(
 
         return self._device_info
 
-    async def async_send_keys(self, keys: list[str]) -> None:
+    async def async_send_keys(
+        self, keys: list[str], key_press_delay: float | None = None
+    ) -> None:
         """Send a list of keys using websocket protocol."""
         await self._async_send_commands(
-            [SendEncryptedRemoteKey.click(key) for key in keys]
+            [SendEncryptedRemoteKey.click(key) for key in keys], key_press_delay
         )
 
     async def _async_get_remote_under_lock(
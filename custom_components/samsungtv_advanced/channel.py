@@ -1,7 +1,7 @@
-from xml.sax.saxutils import escape
+from xml.etree import ElementTree as ET
 import struct
 from .const import LOGGER
-from xml.dom import minidom
+import defusedxml.ElementTree as DET
 
 
 class ContextException(Exception):
@@ -10,9 +10,9 @@ class ContextException(Exception):
     add_context method, and rethrow it to another callee who might again add
     information."""
 
-    def __init__(self, msg, context=[]):
+    def __init__(self, msg, context=None):
         self.msg = msg
-        self.context = list(context)
+        self.context = [] if context is None else list(context)
 
     def __str__(self):
         if self.context:
@@ -29,16 +29,26 @@ class ParseException(ContextException):
     pass
 
 
-def _getint(buf, offset):
-    """Helper function to extract a 16-bit little-endian unsigned from a char
-    buffer 'buf' at offset 'offset'..'offset'+2."""
-    x = struct.unpack('<H', buf[offset:offset + 2])
-    return x[0]
+# A 16-bit little-endian unsigned, as used for the channel count in the header.
+_U16 = struct.Struct('<H')
+
+# A single 124-byte channel list entry, see Channel._parse_dat for the layout.
+_REC = struct.Struct('<6H4s6xH100s')
+
+# Channel type codes as found in a channel list entry, mapped to <ChType>.
+_CH_TYPES = {4: 'CDTV', 3: 'CATV', 2: 'DTV'}
+
+# The <Channel> document expected by SetMainTVChannel.
+_XML_TMPL = ('<?xml version="1.0" encoding="UTF-8" ?><Channel><ChType>%s</ChType><MajorCh>%d'
+             '</MajorCh><MinorCh>%d</MinorCh><PTC>%d</PTC><ProgNum>%d</ProgNum></Channel>')
 
 
 class Channel(object):
     """Class representing a Channel from the TV's channel list."""
 
+    __slots__ = ('ch_type', 'major_ch', 'minor_ch', 'ptc', 'prog_num', 'dispno', 'title',
+                 'as_xml')
+
     @staticmethod
     def _parse_channel_list(channel_list):
         """Splits the binary channel list into channel entry fields and returns a list of Channels."""
@@ -47,66 +57,79 @@ class Channel(object):
         # 2 bytes for the channel count, which must be len(list)-4/124, as each following channel
         # is 124 bytes each. See Channel._parse_dat for how each entry is constructed.
 
-        if len(channel_list) < 128:
+        list_len = len(channel_list)
+        if list_len < 128:
             raise ParseException(('channel list is smaller than it has to be for at least '
-                                  'one channel (%d bytes (actual) vs. 128 bytes' % len(channel_list)),
-                                 ('Channel list: %s' % repr(channel_list)))
+                                  'one channel (%d bytes (actual) vs. 128 bytes' % list_len),
+                                 ['Channel list: %d bytes' % list_len])
 
-        if (len(channel_list)-4) % 124 != 0:
-            raise ParseException(('channel list\'s size (%d) minus 128 (header) is not a multiple of '
-                                  '124 bytes' % len(channel_list)),
-                                 ('Channel list: %s' % repr(channel_list)))
+        if (list_len - 4) % 124 != 0:
+            raise ParseException(('channel list\'s size (%d) minus 4 (header) is not a multiple of '
+                                  '124 bytes' % list_len),
+                                 ['Channel list: %d bytes' % list_len])
 
-        actual_channel_list_len = (len(channel_list)-4) / 124
-        expected_channel_list_len = _getint(channel_list, 2)
+        actual_channel_list_len = (list_len - 4) // 124
+        expected_channel_list_len = _U16.unpack_from(channel_list, 2)[0]
         if actual_channel_list_len != expected_channel_list_len:
             raise ParseException(('Actual channel list length ((%d-4)/124=%d) does not equal expected '
                                   'channel list length (%d) as defined in header' % (
-                                      len(channel_list),
+                                      list_len,
                                       actual_channel_list_len,
-                                      expected_channel_list_len))
-                                 ('Channel list: %s' % repr(channel_list)))
+                                      expected_channel_list_len)),
+                                 ['Channel list: %d bytes' % list_len])
 
-        channels = {}
-        pos = 4
-        while pos < len(channel_list):
-            chunk = channel_list[pos:pos+124]
+        channels = []
+        records = _REC.iter_unpack(memoryview(channel_list)[4:])
+        for index, record in enumerate(records):
             try:
-                ch = Channel(chunk)
-                channels[ch.dispno] = ch
+                ch = Channel(record)
+                channels.append(ch)
             except ParseException as pe:
-                pe.add_context('chunk starting at %d: %s' % (pos, repr(chunk)))
+                pos = 4 + index * 124
+                pe.add_context('chunk starting at %d: %s' % (pos, repr(channel_list[pos:pos+124])))
                 raise pe
 
-            pos += 124
-
-        LOGGER.info('Parsed %d channels', len(channels))
+        LOGGER.debug('Parsed %d channels', len(channels))
         return channels
 
+    @staticmethod
+    def by_dispno(channels):
+        """Returns a dict of the given Channels keyed by their display number."""
+        return {ch.dispno: ch for ch in channels}
+
     def __init__(self, from_dat):
-        """Constructs the Channel object from a binary channel list chunk."""
-        if isinstance(from_dat, minidom.Node):
+        """Constructs the Channel object from a binary channel list chunk or a
+        <Channel> XML document."""
+        if isinstance(from_dat, (str, ET.Element)):
             self._parse_xml(from_dat)
+        elif isinstance(from_dat, tuple):
+            self._parse_record(from_dat)
         else:
             self._parse_dat(from_dat)
 
+        # A Channel doesn't change after parsing, so build its XML representation
+        # for SetMainTVChannel once. ch_type is constrained to the values of
+        # _CH_TYPES, so no XML-escaping needed.
+        self.as_xml = _XML_TMPL % (self.ch_type, self.major_ch,
+                                   self.minor_ch, self.ptc, self.prog_num)
+
     def _parse_xml(self, root):
         try:
-            self.ch_type = root.getElementsByTagName(
-                'ChType')[0].childNodes[0].nodeValue
-            self.major_ch = root.getElementsByTagName(
-                'MajorCh')[0].childNodes[0].nodeValue
-            self.minor_ch = root.getElementsByTagName(
-                'MinorCh')[0].childNodes[0].nodeValue
-            self.ptc = root.getElementsByTagName(
-                'PTC')[0].childNodes[0].nodeValue
-            self.prog_num = root.getElementsByTagName(
-                'ProgNum')[0].childNodes[0].nodeValue
-            self.dispno = self.major_ch
+            if isinstance(root, str):
+                root = DET.fromstring(root)
+            self.ch_type = root.findtext('ChType')
+            self.major_ch = int(root.findtext('MajorCh'))
+            self.minor_ch = int(root.findtext('MinorCh'))
+            self.ptc = int(root.findtext('PTC'))
+            self.prog_num = int(root.findtext('ProgNum'))
+            self.dispno = root.findtext('MajorCh')
             self.title = ''
         except Exception:
             raise ParseException("Wrong XML document")
 
+        if self.ch_type not in _CH_TYPES.values():
+            raise ParseException('Unknown channel type %s' % self.ch_type)
+
     def _parse_dat(self, buf):
         """Parses the binary data from a channel list chunk and initilizes the
         member variables."""
@@ -123,32 +146,35 @@ class Channel(object):
         #                 they have to be :)
         #   [4 bytes string, \0-padded] The (usually 3-digit, for me) channel number
         #                               that's displayed (and which you can enter), in ASCII
+        #   [6 bytes]     Unknown, skipped
         #   [2 bytes int] Length of the channel title
-        #   [106 bytes string, \0-padded] The channel title, in UTF-8 (wow)
-
-        t = _getint(buf, 0)
-        if t == 4:
-            self.ch_type = 'CDTV'
-        elif t == 3:
-            self.ch_type = 'CATV'
-        elif t == 2:
-            self.ch_type = 'DTV'
-        else:
-            raise ParseException('Unknown channel type %d' % t)
+        #   [100 bytes string, \0-padded] The channel title, in UTF-8 (wow)
 
-        self.major_ch = _getint(buf, 2)
-        self.minor_ch = _getint(buf, 4)
-        self.ptc = _getint(buf, 6)
-        self.prog_num = _getint(buf, 8)
+        self._parse_record(_REC.unpack_from(buf))
 
-        if _getint(buf, 10) != 0xffff:
-            raise ParseException(
-                'reserved field mismatch (%04x)' % _getint(buf, 10))
+    def _parse_record(self, record):
+        """Initializes the member variables from a channel list chunk already
+        unpacked with _REC."""
 
-        self.dispno = buf[12:16].decode('utf-8').rstrip('\x00')
+        (t, major_ch, minor_ch, ptc, prog_num, reserved,
+         dispno, title_len, title) = record
 
-        title_len = _getint(buf, 22)
-        self.title = buf[24:24+title_len].decode('utf-8')
+        try:
+            self.ch_type = _CH_TYPES[t]
+        except KeyError:
+            raise ParseException('Unknown channel type %d' % t) from None
+
+        self.major_ch = major_ch
+        self.minor_ch = minor_ch
+        self.ptc = ptc
+        self.prog_num = prog_num
+
+        if reserved != 0xffff:
+            raise ParseException(
+                'reserved field mismatch (%04x)' % reserved)
+
+        self.dispno = dispno.rstrip(b'\x00').decode('ascii')
+        self.title = title[:title_len].decode('utf-8')
 
     def display_string(self):
         """Returns a unicode display string, since both __repr__ and __str__ convert it
@@ -162,14 +188,5 @@ class Channel(object):
             (self.dispno, repr(self.title), self.ch_type, self.major_ch, self.minor_ch, self.ptc,
              self.prog_num)
 
-    @property
-    def as_xml(self):
-        """The channel list as XML representation for SetMainTVChannel."""
-
-        return ('<?xml version="1.0" encoding="UTF-8" ?><Channel><ChType>%s</ChType><MajorCh>%d'
-                '</MajorCh><MinorCh>%d</MinorCh><PTC>%d</PTC><ProgNum>%d</ProgNum></Channel>') % \
-            (escape(self.ch_type), self.major_ch,
-             self.minor_ch, self.ptc, self.prog_num)
-
     def as_params(self, chtype, sid):
         return {'ChannelListType': chtype, 'Channel': self.as_xml, 'SatelliteID': sid}
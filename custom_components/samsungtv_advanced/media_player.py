@@ -2,14 +2,21 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Coroutine, Sequence
+from collections.abc import Awaitable, Coroutine, Sequence
 from datetime import datetime, timedelta
+import socket
 from typing import Any
 from xml.etree import ElementTree as ET
 from xml.sax.saxutils import unescape
 
+import aiohttp
 from async_upnp_client.aiohttp import AiohttpNotifyServer, AiohttpSessionRequester
-from async_upnp_client.client import UpnpDevice, UpnpService, UpnpStateVariable
+from async_upnp_client.client import (
+    UpnpAction,
+    UpnpDevice,
+    UpnpService,
+    UpnpStateVariable,
+)
 from async_upnp_client.client_factory import UpnpFactory
 from async_upnp_client.exceptions import (
     UpnpActionResponseError,
@@ -23,7 +30,7 @@ from async_upnp_client.profiles.dlna import DmrDevice
 from async_upnp_client.utils import async_get_local_ip
 import defusedxml.ElementTree as DET
 import voluptuous as vol
-from wakeonlan import send_magic_packet
+from wakeonlan import BROADCAST_IP, DEFAULT_PORT, create_magic_packet
 
 from homeassistant.components.media_player import (
     MediaPlayerDeviceClass,
@@ -41,19 +48,18 @@ from homeassistant.const import (
     CONF_MAC,
     CONF_MODEL,
     CONF_NAME,
+    EVENT_HOMEASSISTANT_CLOSE,
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entity_component, entity_platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.script import Script
 from homeassistant.helpers.trigger import PluggableAction
-from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import parse_datetime, utcnow
 
 from .bridge import SamsungTVBridge, SamsungTVWSBridge
@@ -94,6 +100,13 @@ SCAN_INTERVAL_PLUS_OFF_TIME = entity_component.DEFAULT_SCAN_INTERVAL + timedelta
 # Max delay waiting for app_list to return, as some TVs simply ignore the request
 APP_LIST_DELAY = 3
 
+# Remote keys for entering a channel number, indexed by digit
+_DIGIT_KEYS = tuple(f"KEY_{digit}" for digit in "0123456789")
+
+# Delay between the keys of a channel number on websocket TVs, which wait a few
+# seconds for the next digit (legacy TVs keep their default key press delay)
+CHANNEL_KEY_PRESS_DELAY = 0.3
+
 
 def async_get_tv_guide_data(hass) -> dict:
     """Retrieve the TV guide data for a specific channel ID from 'aus_tv'."""
@@ -136,16 +149,20 @@ async def async_setup_entry(
 
 
 async def _async_set_dmr_picture(entity: SamsungTVDevice, service_call):
-    if "brightness" in service_call.data:
-        await entity.async_set_brightness_level(service_call.data["brightness"])
-    if "contrast" in service_call.data:
-        await entity.async_set_contrast_level(service_call.data["contrast"])
-    if "sharpness" in service_call.data:
-        await entity.async_set_sharpness_level(service_call.data["sharpness"])
-    if "color_temperature" in service_call.data:
-        await entity.async_set_color_temperature_level(
-            service_call.data["color_temperature"]
+    data = service_call.data
+    # Each setting is a separate UPnP action, so send them concurrently
+    set_picture_tasks: list[Coroutine[Any, Any, None]] = []
+    if "brightness" in data:
+        set_picture_tasks.append(entity.async_set_brightness_level(data["brightness"]))
+    if "contrast" in data:
+        set_picture_tasks.append(entity.async_set_contrast_level(data["contrast"]))
+    if "sharpness" in data:
+        set_picture_tasks.append(entity.async_set_sharpness_level(data["sharpness"]))
+    if "color_temperature" in data:
+        set_picture_tasks.append(
+            entity.async_set_color_temperature_level(data["color_temperature"])
         )
+    await asyncio.gather(*set_picture_tasks)
 
 
 class SamsungTVDevice(MediaPlayerEntity):
@@ -185,6 +202,11 @@ class SamsungTVDevice(MediaPlayerEntity):
         # self._attr_source_list = list(SOURCES)
         self._app_list: dict[str, str] | None = None
         self._app_list_event: asyncio.Event = asyncio.Event()
+        self._app_list_task: asyncio.Task[None] | None = None
+        # Every source that can currently be selected, inputs and apps
+        self._all_sources_set: frozenset[str] = frozenset()
+        # The inputs reported by the TV, in its order
+        self._input_sources: list[str] = []
 
         self._attr_supported_features = SUPPORT_SAMSUNGTV
         if self._on_script or self._mac or self._turn_on:
@@ -208,6 +230,7 @@ class SamsungTVDevice(MediaPlayerEntity):
         # Mark the end of a shutdown command (need to wait 15 seconds before
         # sending the next command to avoid turning the TV back ON).
         self._end_of_power_off: datetime | None = None
+        self._wol_packet: bytes | None = None
         self._bridge = bridge
         self._auth_failed = False
         self._bridge.register_reauth_callback(self.access_denied)
@@ -215,11 +238,30 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         self._dmr_device: DmrDevice | None = None
         self._upnp_server: AiohttpNotifyServer | None = None
+        self._upnp_session: aiohttp.ClientSession | None = None
+        self._upnp_factory: UpnpFactory | None = None
+        self._main_tv_agent_service: UpnpService | None = None
+        self._action_get_current_channel: UpnpAction | None = None
+        self._action_get_source_list: UpnpAction | None = None
+        self._action_set_main_tv_source: UpnpAction | None = None
+
+        # Last channel seen and the guide entry shown for it, to skip
+        # re-parsing and re-computing the media attributes on every poll
+        self._last_channel_xml: str | None = None
+        self._last_channel_dict: dict[str, Any] | None = None
+        self._last_channel_data: dict | None = None
+        self._end_of_current_show: datetime | None = None
+        self._last_source_list_xml: str | None = None
 
     def _update_sources(self) -> None:
         # self._attr_source_list = list(SOURCES)
+        # Build the new list before assigning it, so the inputs reported by the
+        # TV and the apps can each be updated without losing the other
+        source_list = list(self._input_sources)
         if app_list := self._app_list:
-            self._attr_source_list.extend(app_list)
+            source_list.extend(app_list)
+        self._attr_source_list = source_list
+        self._all_sources_set = frozenset(source_list)
 
     def _app_list_callback(self, app_list: dict[str, str]) -> None:
         """App list callback."""
@@ -244,12 +286,30 @@ class SamsungTVDevice(MediaPlayerEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Handle removal."""
+        self._upnp_factory = None
+        if (app_list_task := self._app_list_task) is not None:
+            self._app_list_task = None
+            app_list_task.cancel()
         await self._async_shutdown_dmr()
+        await self._async_close_upnp_session()
+
+    async def _async_close_upnp_session(self, event: Event | None = None) -> None:
+        """Close the aiohttp session used for UPnP traffic to the TV."""
+        self._upnp_factory = None
+        if (upnp_session := self._upnp_session) is not None:
+            self._upnp_session = None
+            await upnp_session.close()
 
     async def async_added_to_hass(self) -> None:
         """Connect and subscribe to dispatcher signals and state updates."""
         await super().async_added_to_hass()
 
+        self.async_on_remove(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_close_upnp_session
+            )
+        )
+
         if (entry := self.registry_entry) and entry.device_id:
             self.async_on_remove(
                 self._turn_on.async_register(
@@ -262,31 +322,62 @@ class SamsungTVDevice(MediaPlayerEntity):
         if self._auth_failed or self.hass.is_stopping:
             return
         old_state = self._attr_state
+        source_list_task: asyncio.Task[None] | None = None
         if self._power_off_in_progress():
             self._attr_state = STATE_OFF
         else:
-            self._attr_state = (
-                STATE_ON if await self._bridge.async_is_on() else STATE_OFF
-            )
+            if old_state == STATE_ON and self._ssdp_main_tv_agent_location:
+                # The TV was on at the last update and most likely still is,
+                # so refresh its sources while checking
+                source_list_task = self.hass.async_create_task(
+                    self._async_startup_source_list()
+                )
+            try:
+                is_on = await self._bridge.async_is_on()
+            except BaseException:
+                if source_list_task is not None:
+                    source_list_task.cancel()
+                raise
+            self._attr_state = STATE_ON if is_on else STATE_OFF
         if self._attr_state != old_state:
             LOGGER.debug("TV %s state updated to %s", self._host, self._attr_state)
 
         if self._attr_state != STATE_ON:
+            if source_list_task is not None:
+                source_list_task.cancel()
+                await asyncio.wait([source_list_task])
+                # The task may have finished before it could be cancelled
+                if not source_list_task.cancelled() and (
+                    err := source_list_task.exception()
+                ):
+                    if not isinstance(err, UpnpError):
+                        raise err
+                    LOGGER.debug(
+                        "Source list of TV %s not refreshed: %s", self._host, err
+                    )
             if self._dmr_device and self._dmr_device.is_subscribed:
                 await self._dmr_device.async_unsubscribe_services()
             return
 
-        startup_tasks: list[Coroutine[Any, Any, Any]] = []
+        # Some TVs never answer the app list request, so wait for it in the
+        # background instead of holding up the update
+        if not self._app_list_event.is_set() and (
+            self._app_list_task is None or self._app_list_task.done()
+        ):
+            self._app_list_task = self.hass.async_create_task(
+                self._async_startup_app_list()
+            )
 
-        if not self._app_list_event.is_set():
-            startup_tasks.append(self._async_startup_app_list())
+        startup_tasks: list[Awaitable[Any]] = []
 
         if self._dmr_device and not self._dmr_device.is_subscribed:
             startup_tasks.append(self._async_resubscribe_dmr())
         if not self._dmr_device and self._ssdp_rendering_control_location:
             startup_tasks.append(self._async_startup_dmr())
 
-        if self._ssdp_main_tv_agent_location:
+        if source_list_task is not None:
+            startup_tasks.append(source_list_task)
+        elif self._ssdp_main_tv_agent_location:
             startup_tasks.append(self._async_startup_source_list())
 
         if startup_tasks:
@@ -294,48 +385,95 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         self._update_from_upnp()
 
-    async def _async_get_main_tv_agent(self):
+    def _get_upnp_factory(self) -> UpnpFactory:
+        """Return the UPnP factory shared by the DMR and MainTVAgent devices."""
+        if (upnp_factory := self._upnp_factory) is None:
+            if self._upnp_session is None:
+                # All UPnP traffic goes to this one TV, so keep a small pool of
+                # kept-alive connections to it that is reused across polls
+                self._upnp_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit_per_host=4, keepalive_timeout=10, force_close=False
+                    )
+                )
+            upnp_requester = AiohttpSessionRequester(self._upnp_session)
+            # Set non_strict to avoid invalid data sent by Samsung TV:
+            # Got invalid value for <UpnpStateVariable(PlaybackStorageMedium, string)>:
+            # NETWORK,NONE
+            upnp_factory = self._upnp_factory = UpnpFactory(
+                upnp_requester, non_strict=True
+            )
+        return upnp_factory
+
+    async def _async_get_main_tv_agent(self) -> UpnpService | None:
+        if (service := self._main_tv_agent_service) is not None:
+            return service
         assert self._ssdp_main_tv_agent_location is not None
         LOGGER.debug("Target: %s", self._ssdp_main_tv_agent_location)
-        session = async_get_clientsession(self.hass)
-        upnp_requester = AiohttpSessionRequester(session)
-        upnp_factory = UpnpFactory(upnp_requester, non_strict=True)
         upnp_device: UpnpDevice | None = None
         try:
-            upnp_device = await upnp_factory.async_create_device(
+            upnp_device = await self._get_upnp_factory().async_create_device(
                 self._ssdp_main_tv_agent_location
             )
         except (UpnpConnectionError, UpnpResponseError, UpnpXmlContentError) as err:
             LOGGER.debug("Unable to create Upnp DMR device: %r", err, exc_info=True)
-            return
-        return upnp_device.service(UPNP_SVC_MAIN_TV_AGENT)
-
-    async def _async_get_channel_info(self) -> None:
-        service = await self._async_get_main_tv_agent()
-        if service is None:
-            return
+            return None
+        service = upnp_device.service(UPNP_SVC_MAIN_TV_AGENT)
+        self._action_get_current_channel = service.actions.get(
+            "GetCurrentMainTVChannel"
+        )
+        self._action_get_source_list = service.actions.get("GetSourceList")
+        self._action_set_main_tv_source = service.actions.get("SetMainTVSource")
+        self._main_tv_agent_service = service
+        return service
+
+    def _reset_main_tv_agent(self) -> None:
+        """Drop the cached service so the next call recreates the device."""
+        self._main_tv_agent_service = None
+        self._action_get_current_channel = None
+        self._action_get_source_list = None
+        self._action_set_main_tv_source = None
+
+    async def _async_get_channel_info(self) -> dict[str, Any] | None:
+        if await self._async_get_main_tv_agent() is None:
+            return None
+        if (action := self._action_get_current_channel) is None:
+            LOGGER.debug("TV %s has no GetCurrentMainTVChannel action", self._host)
+            return None
 
-        get_source_list = service.action("GetCurrentMainTVChannel")
-        result = await get_source_list.async_call()
+        try:
+            result = await action.async_call()
+        except UpnpConnectionError:
+            self._reset_main_tv_agent()
+            raise
         current_channel = unescape(result.get("CurrentChannel"))
+        if current_channel == self._last_channel_xml:
+            return self._last_channel_dict
 
         try:
             xml = DET.fromstring(current_channel)
         except ET.ParseError as err:
             LOGGER.debug("Unable to parse XML: %s\nXML:\n%s", err, current_channel)
+            return None
 
+        # Read all fields in one pass over the children instead of a find() each
+        channel = {child.tag: child.text for child in xml}
         channel_dict = {
-            "ChType": xml.find("ChType").text,
-            "MajorCh": int(xml.find("MajorCh").text),
-            "MinorCh": int(xml.find("MinorCh").text),
-            "PTC": int(xml.find("PTC").text),
-            "ProgNum": int(xml.find("ProgNum").text),
+            "ChType": channel["ChType"],
+            "MajorCh": int(channel["MajorCh"]),
+            "MinorCh": int(channel["MinorCh"]),
+            "PTC": int(channel["PTC"]),
+            "ProgNum": int(channel["ProgNum"]),
         }
 
+        self._last_channel_xml = current_channel
+        self._last_channel_dict = channel_dict
         return channel_dict
 
     def async_clear_channel_info(self):
         """Clear Media Channel Info."""
+        self._last_channel_data = None
+        self._end_of_current_show = None
         self._attr_media_channel = None
         self._attr_media_title = None
         self._attr_media_duration = None
@@ -346,6 +484,8 @@ class SamsungTVDevice(MediaPlayerEntity):
     async def async_set_channel_info(self):
         """Update media attributes based on channel data or clear them."""
         current_channel = await self._async_get_channel_info()
+        if current_channel is None:
+            return self.async_clear_channel_info()
         tv_guide_data = async_get_tv_guide_data(self.hass)
 
         LOGGER.debug("Channel Number: %s", current_channel["MajorCh"])
@@ -356,6 +496,15 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         now = utcnow()
 
+        # The guide coordinator replaces its data on refresh, so the same
+        # object means the same channel and guide as the last update.
+        if (
+            channel_data is self._last_channel_data
+            and self._end_of_current_show is not None
+            and now < self._end_of_current_show
+        ):
+            return
+
         current_show = None
         media_duration = None
         media_position = None
@@ -394,23 +543,46 @@ class SamsungTVDevice(MediaPlayerEntity):
         self._attr_media_content_type = MediaType.CHANNEL
         self._attr_media_position_updated_at = now
 
+        self._last_channel_data = channel_data
+        self._end_of_current_show = now + timedelta(
+            seconds=media_duration - media_position
+        )
+
     async def _async_startup_source_list(self) -> None:
-        service = await self._async_get_main_tv_agent()
-        if service is None:
+        if await self._async_get_main_tv_agent() is None:
+            return
+        if (action := self._action_get_source_list) is None:
+            LOGGER.debug("TV %s has no GetSourceList action", self._host)
             return
 
-        get_source_list = service.action("GetSourceList")
-        result = await get_source_list.async_call()
+        try:
+            result = await action.async_call()
+        except UpnpConnectionError:
+            self._reset_main_tv_agent()
+            raise
         source_list = unescape(result.get("SourceList"))
+        # The TV reports the same list on most polls, only rebuild it on changes
+        if source_list != self._last_source_list_xml:
+            self._update_source_list(source_list)
+            self._last_source_list_xml = source_list
 
+        if self._attr_source == "TV":
+            await self.async_set_channel_info()
+        else:
+            self.async_clear_channel_info()
+
+    def _update_source_list(self, source_list: str) -> None:
         try:
             xml = DET.fromstring(source_list)
         except ET.ParseError as err:
             LOGGER.debug("Unable to parse XML: %s\nXML:\n%s", err, source_list)
+            return
 
+        # Read each element's fields in one pass over its children
+        top_level = {child.tag: child.text for child in xml}
         current_source = {
-            "id": int(xml.find(".//ID").text),
-            "type": xml.find(".//CurrentSourceType").text,
+            "id": int(top_level["ID"]),
+            "type": top_level["CurrentSourceType"],
         }
 
         LOGGER.debug(
@@ -418,32 +590,30 @@ class SamsungTVDevice(MediaPlayerEntity):
         )
         self._attr_source = current_source["type"]
 
-        self._attr_source_list = []
-        self._source_list = {}
-        for source in xml.findall(".//Source"):
-            s_id = int(source.find("ID").text)
-            s_type = source.find("SourceType").text
-            s_name = source.find("DeviceName").text
+        input_sources: list[str] = []
+        inputs: dict[str, dict[str, Any]] = {}
+        for source_element in xml.iter("Source"):
+            source = {child.tag: child.text for child in source_element}
+            s_id = int(source["ID"])
+            s_type = source["SourceType"]
+            s_name = source.get("DeviceName")
             if s_name == "NONE":
                 s_name = None
-            s_connected = True if source.find("Connected").text == "Yes" else False
+            s_connected = source.get("Connected") == "Yes"
             key = s_type
 
-            self._source_list[key] = {
+            inputs[key] = {
                 "id": s_id,
                 "type": s_type,
                 "name": s_name,
                 "connected": s_connected,
             }
 
-            self._attr_source_list.append(key)
-
-        if current_source["type"] == "TV":
-            await self.async_set_channel_info()
-        else:
-            self.async_clear_channel_info()
-            self._attr_source = current_source["type"]
+            input_sources.append(key)
 
+        self._source_list = inputs
+        self._input_sources = input_sources
+        self._update_sources()
         LOGGER.debug("Sources: %s", self._attr_source_list)
 
     @callback
@@ -471,6 +641,9 @@ class SamsungTVDevice(MediaPlayerEntity):
         return has_updates
 
     async def _async_startup_app_list(self) -> None:
+        if self._app_list_event.is_set():
+            # Already received (or given up on), don't ask the TV again
+            return
         await self._bridge.async_request_app_list()
         if self._app_list_event.is_set():
             # The try+wait_for is a bit expensive so we should try not to
@@ -486,26 +659,34 @@ class SamsungTVDevice(MediaPlayerEntity):
     async def _async_startup_dmr(self) -> None:
         assert self._ssdp_rendering_control_location is not None
         if self._dmr_device is None:
-            session = async_get_clientsession(self.hass)
-            upnp_requester = AiohttpSessionRequester(session)
-            # Set non_strict to avoid invalid data sent by Samsung TV:
-            # Got invalid value for <UpnpStateVariable(PlaybackStorageMedium, string)>:
-            # NETWORK,NONE
-            upnp_factory = UpnpFactory(upnp_requester, non_strict=True)
-            upnp_device: UpnpDevice | None = None
-            try:
-                upnp_device = await upnp_factory.async_create_device(
-                    self._ssdp_rendering_control_location
+            upnp_factory = self._get_upnp_factory()
+            # Fetching the device description and finding the local IP towards
+            # the TV are independent, so do both at once
+            upnp_device, local_ip = await asyncio.gather(
+                upnp_factory.async_create_device(self._ssdp_rendering_control_location),
+                async_get_local_ip(
+                    self._ssdp_rendering_control_location, self.hass.loop
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(
+                upnp_device,
+                (UpnpConnectionError, UpnpResponseError, UpnpXmlContentError),
+            ):
+                LOGGER.debug(
+                    "Unable to create Upnp DMR device: %r",
+                    upnp_device,
+                    exc_info=upnp_device,
                 )
-            except (UpnpConnectionError, UpnpResponseError, UpnpXmlContentError) as err:
-                LOGGER.debug("Unable to create Upnp DMR device: %r", err, exc_info=True)
                 return
-            _, event_ip = await async_get_local_ip(
-                self._ssdp_rendering_control_location, self.hass.loop
-            )
+            if isinstance(upnp_device, BaseException):
+                raise upnp_device
+            if isinstance(local_ip, BaseException):
+                raise local_ip
+            _, event_ip = local_ip
             source = (event_ip or "0.0.0.0", 0)
             self._upnp_server = AiohttpNotifyServer(
-                requester=upnp_requester,
+                requester=upnp_factory.requester,
                 source=source,
                 callback_url=None,
                 loop=self.hass.loop,
@@ -563,19 +744,19 @@ class SamsungTVDevice(MediaPlayerEntity):
         assert isinstance(self._bridge, SamsungTVWSBridge)
         await self._bridge.async_launch_app(app_id)
 
-    async def _async_send_keys(self, keys: list[str]) -> None:
+    async def _async_send_keys(
+        self, keys: list[str], key_press_delay: float | None = None
+    ) -> None:
         """Send a key to the tv and handles exceptions."""
         assert keys
         if self._power_off_in_progress() and keys[0] != "KEY_POWEROFF":
             LOGGER.info("TV is powering off, not sending keys: %s", keys)
             return
-        await self._bridge.async_send_keys(keys)
+        await self._bridge.async_send_keys(keys, key_press_delay)
 
     def _power_off_in_progress(self) -> bool:
-        return (
-            self._end_of_power_off is not None
-            and self._end_of_power_off > dt_util.utcnow()
-        )
+        end_of_power_off = self._end_of_power_off
+        return end_of_power_off is not None and end_of_power_off > utcnow()
 
     @property
     def available(self) -> bool:
@@ -592,7 +773,7 @@ class SamsungTVDevice(MediaPlayerEntity):
 
     async def async_turn_off(self) -> None:
         """Turn off media player."""
-        self._end_of_power_off = dt_util.utcnow() + SCAN_INTERVAL_PLUS_OFF_TIME
+        self._end_of_power_off = utcnow() + SCAN_INTERVAL_PLUS_OFF_TIME
         await self._bridge.async_power_off()
 
     async def async_set_volume_level(self, volume: float) -> None:
@@ -654,23 +835,31 @@ class SamsungTVDevice(MediaPlayerEntity):
             LOGGER.error("Unsupported media type")
             return
 
-        # media_id should only be a channel number
-        try:
-            cv.positive_int(media_id)
-        except vol.Invalid:
+        # media_id should only be a channel number, entered digit by digit
+        # (cv.positive_int would also accept a sign or surrounding whitespace)
+        if not (media_id.isascii() and media_id.isdigit()):
             LOGGER.error("Media ID must be positive integer")
             return
 
         await self._async_send_keys(
-            keys=[f"KEY_{digit}" for digit in media_id] + ["KEY_ENTER"]
+            keys=[_DIGIT_KEYS[int(digit)] for digit in media_id] + ["KEY_ENTER"],
+            key_press_delay=CHANNEL_KEY_PRESS_DELAY,
         )
 
     def _wake_on_lan(self) -> None:
         """Wake the device via wake on lan."""
-        send_magic_packet(self._mac, ip_address=self._host)
-        # If the ip address changed since we last saw the device
-        # broadcast a packet as well
-        send_magic_packet(self._mac)
+        assert self._mac is not None
+        if (packet := self._wol_packet) is None:
+            packet = self._wol_packet = create_magic_packet(self._mac)
+        # Sending two small datagrams on a non-blocking socket doesn't need a
+        # thread, the host is stored as an IP address so nothing is resolved
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.sendto(packet, (self._host, DEFAULT_PORT))
+            # If the ip address changed since we last saw the device
+            # broadcast a packet as well
+            sock.sendto(packet, (BROADCAST_IP, DEFAULT_PORT))
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
@@ -679,24 +868,27 @@ class SamsungTVDevice(MediaPlayerEntity):
         elif self._turn_on:
             await self._turn_on.async_run(self.hass, self._context)
         elif self._mac:
-            await self.hass.async_add_executor_job(self._wake_on_lan)
+            self._wake_on_lan()
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        if self._app_list and source in self._app_list:
-            await self._async_launch_app(self._app_list[source])
+        if source not in self._all_sources_set:
+            LOGGER.error("Unsupported source")
             return
 
-        if source in self._source_list:
-            await self._async_upnp_select_source(source)
+        if self._app_list and source in self._app_list:
+            await self._async_launch_app(self._app_list[source])
             return
 
-        LOGGER.error("Unsupported source")
+        await self._async_upnp_select_source(source)
 
     async def _async_upnp_select_source(self, key: str) -> None:
-        service = await self._async_get_main_tv_agent()
-        get_source_list = service.action("SetMainTVSource")
-        result = await get_source_list.async_call(
+        if await self._async_get_main_tv_agent() is None:
+            return
+        if (action := self._action_set_main_tv_source) is None:
+            LOGGER.debug("TV %s has no SetMainTVSource action", self._host)
+            return
+        result = await action.async_call(
             Source=self._source_list[key]["type"],
             ID=self._source_list[key]["id"],
             UiID=0,
@@ -705,16 +897,28 @@ class SamsungTVDevice(MediaPlayerEntity):
 
     async def async_set_brightness_level(self, brightness: float) -> None:
         """Set the brightness level of the device asynchronously."""
-        await self._dmr_device.async_set_brightness_level(brightness)
+        if (dmr_device := self._dmr_device) is None:
+            LOGGER.info("Upnp services are not available on %s", self._host)
+            return
+        await dmr_device.async_set_brightness_level(brightness)
 
     async def async_set_contrast_level(self, contrast: float) -> None:
         """Set the contrast level of the device asynchronously."""
-        await self._dmr_device.async_set_contrast_level(contrast)
+        if (dmr_device := self._dmr_device) is None:
+            LOGGER.info("Upnp services are not available on %s", self._host)
+            return
+        await dmr_device.async_set_contrast_level(contrast)
 
     async def async_set_sharpness_level(self, sharpness: float) -> None:
         """Set the sharpness level of the device asynchronously."""
-        await self._dmr_device.async_set_sharpness_level(sharpness)
+        if (dmr_device := self._dmr_device) is None:
+            LOGGER.info("Upnp services are not available on %s", self._host)
+            return
+        await dmr_device.async_set_sharpness_level(sharpness)
 
     async def async_set_color_temperature_level(self, color_temperature: float) -> None:
         """Set the color temperature level of the device asynchronously."""
-        await self._dmr_device.async_set_color_temperature_level(color_temperature)
+        if (dmr_device := self._dmr_device) is None:
+            LOGGER.info("Upnp services are not available on %s", self._host)
+            return
+        await dmr_device.async_set_color_temperature_level(color_temperature)